@@ -1,5 +1,10 @@
-"""Configuration module for API Key Manager Pro."""
+"""Configuration module for API Key Manager Pro.
 
-from .settings import Settings
+``get_settings()`` returns the shared :class:`Settings` instance. Class-level
+reads such as ``Settings.PORT`` still work, but ``to_dict()`` is an instance
+method: call ``get_settings().to_dict()`` rather than ``Settings.to_dict()``.
+"""
 
-__all__ = ["Settings"]
+from .settings import Settings, get_settings
+
+__all__ = ["Settings", "get_settings"]
@@ -1,59 +1,124 @@
 """Settings configuration for API Key Manager Pro."""
 
 import os
-from typing import Optional
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Tuple
 
 
+def _to_bool(value: str) -> bool:
+    """Parse a boolean environment flag."""
+    return value.lower() == "true"
+
+
+# (name, cast, default) for every environment-backed setting
+_ENV_FIELDS: Tuple[Tuple[str, Callable[[str], Any], Optional[str]], ...] = (
+    # Validation settings
+    ("VALIDATION_WINDOW_MINUTES", int, "360"),
+    ("CLOCK_SKEW_TOLERANCE_SECONDS", int, "60"),
+    # Flask settings
+    ("DEBUG", _to_bool, "False"),
+    ("SECRET_KEY", str, "dev-secret-key"),
+    ("HOST", str, "0.0.0.0"),
+    ("PORT", int, "5000"),
+    # Database settings
+    ("DATABASE_URL", str, None),
+    # Vault settings
+    ("VAULT_ENABLED", _to_bool, "False"),
+    ("VAULT_ADDR", str, "http://127.0.0.1:8200"),
+    ("VAULT_TOKEN", str, None),
+    ("VAULT_NAMESPACE", str, "kv"),
+    # Logging settings
+    ("LOG_LEVEL", str, "INFO"),
+    (
+        "LOG_FORMAT",
+        str,
+        "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    ),
+    # Cache settings
+    ("CACHE_TTL_SECONDS", int, "300"),
+    # Rate limiting
+    ("RATE_LIMIT_ENABLED", _to_bool, "False"),
+    ("RATE_LIMIT_PER_MINUTE", int, "100"),
+)
+
+_SECRET_FIELDS = frozenset({"SECRET_KEY", "VAULT_TOKEN"})
+
+
+def _read_env() -> Dict[str, Any]:
+    """Parse every environment-backed setting from the current environment."""
+    environ = dict(os.environ)
+    values = {}
+    for name, cast, default in _ENV_FIELDS:
+        raw = environ.get(name, default)
+        values[name] = None if raw is None else cast(raw)
+    return values
+
+
+# Parsed once at import; these are the field defaults, so ``Settings()`` and
+# class-level reads such as ``Settings.PORT`` keep working
+_ENV = _read_env()
+
+
+@dataclass(frozen=True)
 class Settings:
     """Application settings."""
 
     # Validation settings
-    VALIDATION_WINDOW_MINUTES: int = int(
-        os.getenv("VALIDATION_WINDOW_MINUTES", "360")
-    )
-    CLOCK_SKEW_TOLERANCE_SECONDS: int = int(
-        os.getenv("CLOCK_SKEW_TOLERANCE_SECONDS", "60")
-    )
+    VALIDATION_WINDOW_MINUTES: int = _ENV["VALIDATION_WINDOW_MINUTES"]
+    CLOCK_SKEW_TOLERANCE_SECONDS: int = _ENV["CLOCK_SKEW_TOLERANCE_SECONDS"]
 
     # Flask settings
-    DEBUG: bool = os.getenv("DEBUG", "False").lower() == "true"
-    SECRET_KEY: str = os.getenv("SECRET_KEY", "dev-secret-key")
-    HOST: str = os.getenv("HOST", "0.0.0.0")
-    PORT: int = int(os.getenv("PORT", "5000"))
+    DEBUG: bool = _ENV["DEBUG"]
+    SECRET_KEY: str = _ENV["SECRET_KEY"]
+    HOST: str = _ENV["HOST"]
+    PORT: int = _ENV["PORT"]
 
     # Database settings
-    DATABASE_URL: Optional[str] = os.getenv("DATABASE_URL")
+    DATABASE_URL: Optional[str] = _ENV["DATABASE_URL"]
 
     # Vault settings
-    VAULT_ENABLED: bool = os.getenv("VAULT_ENABLED", "False").lower() == "true"
-    VAULT_ADDR: str = os.getenv("VAULT_ADDR", "http://127.0.0.1:8200")
-    VAULT_TOKEN: Optional[str] = os.getenv("VAULT_TOKEN")
-    VAULT_NAMESPACE: str = os.getenv("VAULT_NAMESPACE", "kv")
+    VAULT_ENABLED: bool = _ENV["VAULT_ENABLED"]
+    VAULT_ADDR: str = _ENV["VAULT_ADDR"]
+    VAULT_TOKEN: Optional[str] = _ENV["VAULT_TOKEN"]
+    VAULT_NAMESPACE: str = _ENV["VAULT_NAMESPACE"]
 
     # Logging settings
-    LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
-    LOG_FORMAT: str = os.getenv(
-        "LOG_FORMAT",
-        "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    )
+    LOG_LEVEL: str = _ENV["LOG_LEVEL"]
+    LOG_FORMAT: str = _ENV["LOG_FORMAT"]
 
     # Cache settings
-    CACHE_TTL_SECONDS: int = int(os.getenv("CACHE_TTL_SECONDS", "300"))
+    CACHE_TTL_SECONDS: int = _ENV["CACHE_TTL_SECONDS"]
 
     # Rate limiting
-    RATE_LIMIT_ENABLED: bool = (
-        os.getenv("RATE_LIMIT_ENABLED", "False").lower() == "true"
-    )
-    RATE_LIMIT_PER_MINUTE: int = int(
-        os.getenv("RATE_LIMIT_PER_MINUTE", "100")
+    RATE_LIMIT_ENABLED: bool = _ENV["RATE_LIMIT_ENABLED"]
+    RATE_LIMIT_PER_MINUTE: int = _ENV["RATE_LIMIT_PER_MINUTE"]
+
+    _public_dict: Dict[str, Any] = field(
+        init=False, repr=False, compare=False
     )
 
+    def __post_init__(self) -> None:
+        """Precompute the redacted settings dictionary."""
+        public = {
+            f.name: getattr(self, f.name)
+            for f in fields(self)
+            if f.init and f.name not in _SECRET_FIELDS
+        }
+        object.__setattr__(self, "_public_dict", public)
+
     @classmethod
-    def to_dict(cls) -> dict:
+    def from_env(cls) -> "Settings":
+        """Build settings from the environment as it is now."""
+        return cls(**_read_env())
+
+    def to_dict(self) -> dict:
         """Convert settings to dictionary (excluding secrets)."""
-        return {
-            key: getattr(cls, key)
-            for key in dir(cls)
-            if not key.startswith("_") and key.isupper()
-            and key not in ["SECRET_KEY", "VAULT_TOKEN"]
-        }
+        # Copy, so callers can't mutate the shared cached settings
+        return dict(self._public_dict)
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the process-wide settings instance."""
+    return Settings()
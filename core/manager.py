@@ -1,28 +1,64 @@
 """API Key Manager for batch operations and key lifecycle management."""
 
 import asyncio
+import hashlib
+import hmac
 import logging
-from datetime import datetime
-from typing import Dict, List, Optional
+import time
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Deque, Dict, List, NamedTuple, Optional
 
 from .exceptions import KeyNotFoundError
 from .validator import AsyncAPIKeyValidator
 
 logger = logging.getLogger(__name__)
 
+REDACTED = "***REDACTED***"
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _format_ts(ns: int) -> str:
+    """Format a Unix timestamp in nanoseconds as a naive UTC ISO string."""
+    return (_EPOCH + timedelta(microseconds=ns // 1000)).isoformat()
+
+
+def _export_record(public: Dict) -> Dict:
+    """Copy a public key record with its nanosecond timestamps as ISO strings."""
+    last_used = public["last_used"]
+    return {
+        **public,
+        "created_at": _format_ts(public["created_at"]),
+        "last_used": None if last_used is None else _format_ts(last_used),
+    }
+
+
+class AuditEntry(NamedTuple):
+    """Audit log entry as stored in memory."""
+
+    ts: int
+    action: str
+    key_id: str
+
 
 class KeyManager:
     """Manages API keys lifecycle including creation, validation, and revocation."""
 
-    def __init__(self, validator: Optional[AsyncAPIKeyValidator] = None):
+    def __init__(
+        self,
+        validator: Optional[AsyncAPIKeyValidator] = None,
+        audit_log_maxlen: int = 100_000,
+    ):
         """Initialize Key Manager.
 
         Args:
             validator: AsyncAPIKeyValidator instance. If None, creates a new one.
+            audit_log_maxlen: Number of most recent audit entries kept (default: 100000)
         """
         self.validator = validator or AsyncAPIKeyValidator()
         self._keys: Dict[str, Dict] = {}
-        self._audit_log: List[Dict] = []
+        self._audit_log: Deque[AuditEntry] = deque(maxlen=audit_log_maxlen)
 
     async def create_key(
         self,
@@ -40,22 +76,27 @@ class KeyManager:
         Returns:
             Created key record
         """
-        await asyncio.sleep(0)
-
-        key_record = {
+        # Redacted view returned by get_key/list_keys; it is the only copy
+        # of the mutable lifecycle fields, so it never needs re-syncing.
+        public_record = {
             "key_id": key_id,
-            "secret": secret,
-            "created_at": datetime.utcnow().isoformat(),
+            "secret": REDACTED,
+            "created_at": time.time_ns(),
             "metadata": metadata or {},
             "active": True,
             "last_used": None,
         }
-
-        self._keys[key_id] = key_record
+        secret_bytes = secret.encode()
+        self._keys[key_id] = {
+            "secret": secret,
+            "secret_bytes": secret_bytes,
+            "hmac_template": hmac.new(secret_bytes, None, hashlib.sha256),
+            "_public": public_record,
+        }
         self._log_audit("key_created", key_id)
         logger.info(f"Key created: {key_id}")
 
-        return key_record
+        return {**_export_record(public_record), "secret": secret}
 
     async def revoke_key(self, key_id: str) -> bool:
         """Revoke an API key.
@@ -69,12 +110,11 @@ class KeyManager:
         Raises:
             KeyNotFoundError: If key doesn't exist
         """
-        await asyncio.sleep(0)
-
-        if key_id not in self._keys:
+        key_record = self._keys.get(key_id)
+        if key_record is None:
             raise KeyNotFoundError(f"Key not found: {key_id}")
 
-        self._keys[key_id]["active"] = False
+        key_record["_public"]["active"] = False
         self._log_audit("key_revoked", key_id)
         logger.info(f"Key revoked: {key_id}")
 
@@ -99,22 +139,23 @@ class KeyManager:
         Raises:
             KeyNotFoundError: If key doesn't exist
         """
-        if key_id not in self._keys:
+        key_record = self._keys.get(key_id)
+        if key_record is None:
             raise KeyNotFoundError(f"Key not found: {key_id}")
 
-        key_record = self._keys[key_id]
-        if not key_record["active"]:
+        if not key_record["_public"]["active"]:
             raise KeyNotFoundError(f"Key is revoked: {key_id}")
 
         result = await self.validator.validate(
             key_id,
             signature,
-            key_record["secret"],
+            key_record["secret_bytes"],
             timestamp=timestamp,
+            hmac_template=key_record["hmac_template"],
         )
 
         if result:
-            self._keys[key_id]["last_used"] = datetime.utcnow().isoformat()
+            key_record["_public"]["last_used"] = time.time_ns()
             self._log_audit("key_validated", key_id)
 
         return result
@@ -126,19 +167,17 @@ class KeyManager:
             key_id: Key to retrieve
 
         Returns:
-            Key record (secret redacted)
+            Copy of the key record (secret redacted)
 
         Raises:
             KeyNotFoundError: If key doesn't exist
         """
-        await asyncio.sleep(0)
-
-        if key_id not in self._keys:
+        key_record = self._keys.get(key_id)
+        if key_record is None:
             raise KeyNotFoundError(f"Key not found: {key_id}")
 
-        key_record = self._keys[key_id].copy()
-        key_record["secret"] = "***REDACTED***"
-        return key_record
+        # Fresh dict: JSON-serializable and unaffected by later updates
+        return _export_record(key_record["_public"])
 
     async def batch_validate(
         self,
@@ -152,20 +191,28 @@ class KeyManager:
         Returns:
             List of validation results
         """
-        tasks = [
-            self.validate_key(
+        return await asyncio.gather(
+            *[self._safe_validate(validation) for validation in validations]
+        )
+
+    async def _safe_validate(self, validation: Dict) -> Dict:
+        """Validate a single batch entry, reporting any failure as invalid.
+
+        Args:
+            validation: Dict with 'key_id', 'signature' and optional 'timestamp'
+
+        Returns:
+            Validation result for the entry
+        """
+        try:
+            valid = await self.validate_key(
                 validation["key_id"],
                 validation["signature"],
                 validation.get("timestamp"),
             )
-            for validation in validations
-        ]
-
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        return [
-            {"key_id": v["key_id"], "valid": not isinstance(r, Exception)}
-            for v, r in zip(validations, results)
-        ]
+        except Exception:
+            valid = False
+        return {"key_id": validation["key_id"], "valid": valid}
 
     def list_keys(self, active_only: bool = True) -> List[Dict]:
         """List all keys.
@@ -174,22 +221,29 @@ class KeyManager:
             active_only: If True, only return active keys
 
         Returns:
-            List of key records (secrets redacted)
+            List of key record copies (secrets redacted)
         """
-        keys = [
-            {**k, "secret": "***REDACTED***"}
-            for k in self._keys.values()
-            if not active_only or k["active"]
+        return [
+            _export_record(public)
+            for public in (k["_public"] for k in self._keys.values())
+            if not active_only or public["active"]
         ]
-        return keys
 
     def get_audit_log(self) -> List[Dict]:
         """Get audit log entries.
 
         Returns:
-            Audit log
+            Most recent audit entries, oldest first, with ISO formatted
+            timestamps
         """
-        return self._audit_log.copy()
+        return [
+            {
+                "timestamp": _format_ts(entry.ts),
+                "action": entry.action,
+                "key_id": entry.key_id,
+            }
+            for entry in self._audit_log
+        ]
 
     def _log_audit(self, action: str, key_id: str) -> None:
         """Log an audit event.
@@ -198,12 +252,7 @@ class KeyManager:
             action: Action performed
             key_id: Key affected
         """
-        entry = {
-            "timestamp": datetime.utcnow().isoformat(),
-            "action": action,
-            "key_id": key_id,
-        }
-        self._audit_log.append(entry)
+        self._audit_log.append(AuditEntry(time.time_ns(), action, key_id))
         logger.debug(f"Audit: {action} - {key_id}")
 
     def clear(self) -> None:
@@ -3,16 +3,64 @@
 import asyncio
 import hashlib
 import hmac
+import multiprocessing
+import re
 import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import timedelta
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 
+from .cache import TTLCache
 from .exceptions import (
     InvalidSignatureError,
     KeyExpiredError,
     ValidationError,
 )
 
+BATCH_CHUNK_SIZE = 256
+THREAD_CHUNK_SIZE = 32
+
+# Exactly what hexdigest() produces for SHA-256
+_SIGNATURE_PATTERN = re.compile(r"[0-9a-f]{64}")
+
+
+def _decode_signature(signature: str) -> Optional[bytes]:
+    """Decode a hex signature, or return None if it is not well formed.
+
+    ``bytes.fromhex`` alone would also accept whitespace and upper-case
+    digits, letting many spellings of one signature validate.
+    """
+    if not isinstance(signature, str) or not _SIGNATURE_PATTERN.fullmatch(
+        signature
+    ):
+        return None
+    return bytes.fromhex(signature)
+
+
+def _verify_chunk(
+    chunk: List[Tuple[str, str, Union[str, bytes]]]
+) -> List[bool]:
+    """Verify a chunk of (key, signature, secret) triples.
+
+    Runs in a worker thread or process, so it must stay a picklable
+    top-level function without access to the validator state. A malformed
+    entry is reported as ``False`` rather than failing the whole chunk.
+    """
+    results = []
+    for key, signature, secret in chunk:
+        try:
+            if isinstance(secret, str):
+                secret = secret.encode()
+            expected = hmac.digest(secret, key.encode(), "sha256")
+            provided = _decode_signature(signature)
+        except Exception:
+            results.append(False)
+            continue
+        results.append(
+            provided is not None and hmac.compare_digest(expected, provided)
+        )
+    return results
+
 
 class AsyncAPIKeyValidator:
     """Async validator for API keys using HMAC-SHA256 signatures."""
@@ -21,34 +69,50 @@ class AsyncAPIKeyValidator:
         self,
         validation_window_minutes: int = 360,
         clock_skew_tolerance_seconds: int = 60,
+        cache_maxsize: int = 65536,
+        batch_threshold: int = 1024,
+        thread_batch_threshold: int = 32,
     ):
         """Initialize the validator.
 
         Args:
             validation_window_minutes: Time window for key validation in minutes (default: 360/6 hours)
             clock_skew_tolerance_seconds: Clock skew tolerance in seconds (default: 60)
+            cache_maxsize: Maximum number of cached validation results (default: 65536)
+            batch_threshold: Batch size from which signatures are verified in
+                a process pool instead of on the event loop (default: 1024)
+            thread_batch_threshold: Batch size from which signatures are
+                verified in a thread pool instead of on the event loop
+                (default: 32)
         """
         self.validation_window = timedelta(minutes=validation_window_minutes)
         self.clock_skew_tolerance = clock_skew_tolerance_seconds
-        self._cache: Dict[str, Tuple[bool, float]] = {}
         self._cache_ttl = 300  # 5 minutes
+        self._cache = TTLCache(maxsize=cache_maxsize, ttl=self._cache_ttl)
+        self.batch_threshold = batch_threshold
+        self.thread_batch_threshold = thread_batch_threshold
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
 
     async def validate(
         self,
         key: str,
         signature: str,
-        secret: str,
+        secret: Union[str, bytes],
         timestamp: Optional[int] = None,
         use_cache: bool = True,
+        hmac_template: Optional[hmac.HMAC] = None,
     ) -> bool:
         """Validate API key signature.
 
         Args:
             key: API key string
             signature: HMAC-SHA256 signature in hex format
-            secret: Secret key for HMAC verification
+            secret: Secret key for HMAC verification (str or pre-encoded bytes)
             timestamp: Unix timestamp (uses current time if not provided)
             use_cache: Whether to use cached validation results
+            hmac_template: Optional HMAC-SHA256 object already keyed with
+                ``secret``; copied instead of re-keying on every call
 
         Returns:
             True if signature is valid and within time window
@@ -60,27 +124,28 @@ class AsyncAPIKeyValidator:
         """
         try:
             # Check cache
+            cache_key = None
             if use_cache:
-                cache_key = f"{key}:{signature}"
-                if cache_key in self._cache:
-                    is_valid, cache_time = self._cache[cache_key]
-                    if time.time() - cache_time < self._cache_ttl:
-                        return is_valid
+                cache_key = self._cache_key(key, signature)
+                cached = self._cache.get(cache_key)
+                if cached is not None:
+                    return cached
 
             # Use current time if not provided
             if timestamp is None:
                 timestamp = int(time.time())
 
             # Check timestamp validity
-            await self._validate_timestamp(timestamp)
+            self._validate_timestamp(timestamp)
 
             # Verify signature
-            await self._verify_signature(key, signature, secret)
+            if isinstance(secret, str):
+                secret = secret.encode()
+            self._verify_signature(key, signature, secret, hmac_template)
 
             # Cache result
-            if use_cache:
-                cache_key = f"{key}:{signature}"
-                self._cache[cache_key] = (True, time.time())
+            if cache_key is not None:
+                self._cache[cache_key] = True
 
             return True
 
@@ -89,7 +154,17 @@ class AsyncAPIKeyValidator:
         except Exception as e:
             raise ValidationError(f"Validation failed: {str(e)}") from e
 
-    async def _validate_timestamp(self, timestamp: int) -> None:
+    @staticmethod
+    def _cache_key(key: str, signature: str) -> bytes:
+        """Build a fixed-size cache key for a key/signature pair.
+
+        The key length is mixed in so that different splits of the same
+        concatenated string never share an entry.
+        """
+        material = f"{len(key)}:{key}{signature}".encode()
+        return hashlib.blake2b(material, digest_size=16).digest()
+
+    def _validate_timestamp(self, timestamp: int) -> None:
         """Validate timestamp is within acceptable window.
 
         Args:
@@ -98,7 +173,6 @@ class AsyncAPIKeyValidator:
         Raises:
             KeyExpiredError: If timestamp is outside window
         """
-        await asyncio.sleep(0)  # Yield to event loop
         current_time = time.time()
         age = current_time - timestamp
 
@@ -115,35 +189,42 @@ class AsyncAPIKeyValidator:
                 f"Key timestamp is in future. Skew: {-age}s"
             )
 
-    async def _verify_signature(
+    def _verify_signature(
         self,
         key: str,
         provided_signature: str,
-        secret: str,
+        secret_bytes: bytes,
+        hmac_template: Optional[hmac.HMAC] = None,
     ) -> None:
         """Verify HMAC-SHA256 signature using constant-time comparison.
 
         Args:
             key: API key string
             provided_signature: Signature to verify (hex string)
-            secret: Secret key for HMAC
+            secret_bytes: Encoded secret key for HMAC
+            hmac_template: Optional pre-keyed HMAC object for ``secret_bytes``
 
         Raises:
             InvalidSignatureError: If signature doesn't match
         """
-        await asyncio.sleep(0)  # Yield to event loop
-
         # Calculate expected signature
-        message = key.encode()
-        secret_bytes = secret.encode()
-        expected_signature = hmac.new(
-            secret_bytes,
-            message,
-            hashlib.sha256
-        ).hexdigest()
+        if hmac_template is not None:
+            mac = hmac_template.copy()
+            mac.update(key.encode())
+            expected_signature = mac.digest()
+        else:
+            expected_signature = hmac.digest(
+                secret_bytes, key.encode(), "sha256"
+            )
+
+        provided_bytes = _decode_signature(provided_signature)
+        if provided_bytes is None:
+            raise InvalidSignatureError(
+                "HMAC signature is not a 64-character lowercase hex digest"
+            )
 
         # Use constant-time comparison to prevent timing attacks
-        if not hmac.compare_digest(expected_signature, provided_signature):
+        if not hmac.compare_digest(expected_signature, provided_bytes):
             raise InvalidSignatureError(
                 "HMAC signature verification failed"
             )
@@ -151,15 +232,31 @@ class AsyncAPIKeyValidator:
     async def batch_validate(
         self,
         validations: list[Dict[str, str]],
+        fail_fast: bool = False,
     ) -> list[bool]:
         """Validate multiple keys concurrently.
 
+        Batches of at least ``batch_threshold`` entries are split into
+        chunks and verified in a process pool, and batches of at least
+        ``thread_batch_threshold`` entries in a thread pool, keeping the
+        event loop free. Those signatures are checked against the current
+        time, so the validation window always holds, and the result cache
+        is bypassed.
+
         Args:
             validations: List of dicts with 'key', 'signature', and 'secret'
+            fail_fast: Stop at the first failure and report the whole batch
+                as invalid, for callers that only need the aggregate answer
 
         Returns:
             List of validation results (True/False for each)
         """
+        if len(validations) >= self.thread_batch_threshold:
+            return await self._batch_verify_off_loop(validations, fail_fast)
+
+        if fail_fast and validations:
+            return await self._batch_validate_fail_fast(validations)
+
         tasks = [
             self.validate(
                 validation["key"],
@@ -171,6 +268,84 @@ class AsyncAPIKeyValidator:
         results = await asyncio.gather(*tasks, return_exceptions=True)
         return [not isinstance(r, Exception) for r in results]
 
+    async def _batch_validate_fail_fast(
+        self,
+        validations: list[Dict[str, str]],
+    ) -> list[bool]:
+        """Validate in order, stopping at the first failure."""
+        for validation in validations:
+            try:
+                await self.validate(
+                    validation["key"],
+                    validation["signature"],
+                    validation["secret"],
+                )
+            except Exception:
+                return [False] * len(validations)
+        return [True] * len(validations)
+
+    async def _batch_verify_off_loop(
+        self,
+        validations: list[Dict[str, str]],
+        fail_fast: bool = False,
+    ) -> list[bool]:
+        """Verify signatures in chunks across a process or thread pool.
+
+        With ``fail_fast``, chunks are collected as they finish and the
+        remaining ones are cancelled once any chunk contains a failure.
+        """
+        executor: Executor
+        if len(validations) >= self.batch_threshold:
+            if self._pool is None:
+                # Spawn rather than fork: the thread pool (or a threaded
+                # server) may already be running threads in this process
+                self._pool = ProcessPoolExecutor(
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+            executor, chunk_size = self._pool, BATCH_CHUNK_SIZE
+        else:
+            if self._thread_pool is None:
+                self._thread_pool = ThreadPoolExecutor()
+            executor, chunk_size = self._thread_pool, THREAD_CHUNK_SIZE
+
+        triples = [
+            (v["key"], v["signature"], v["secret"]) for v in validations
+        ]
+        loop = asyncio.get_running_loop()
+        futures = [
+            loop.run_in_executor(
+                executor,
+                _verify_chunk,
+                triples[i:i + chunk_size],
+            )
+            for i in range(0, len(triples), chunk_size)
+        ]
+        if not fail_fast:
+            chunk_results = await asyncio.gather(*futures)
+            return [result for chunk in chunk_results for result in chunk]
+
+        pending = set(futures)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not all(all(future.result()) for future in done):
+                    return [False] * len(validations)
+        finally:
+            for future in pending:
+                future.cancel()
+        return [True] * len(validations)
+
+    def close(self) -> None:
+        """Shut down the batch verification pools, if started."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        if self._thread_pool is not None:
+            self._thread_pool.shutdown()
+            self._thread_pool = None
+
     def clear_cache(self) -> None:
         """Clear the validation cache."""
         self._cache.clear()
@@ -0,0 +1,42 @@
+"""Tests for TTLCache."""
+
+from core import cache as cache_module
+from core.cache import TTLCache
+
+
+def test_evicts_least_recently_used_at_maxsize():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache["a"] = 1
+    cache["b"] = 2
+    cache["c"] = 3
+
+    assert len(cache) == 2
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    assert cache.get("c") == 3
+
+
+def test_get_refreshes_recency():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache["a"] = 1
+    cache["b"] = 2
+    assert cache.get("a") == 1
+
+    cache["c"] = 3
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    cache = TTLCache(maxsize=10, ttl=5)
+    cache["a"] = 1
+
+    now[0] += 4.9
+    assert cache.get("a") == 1
+
+    now[0] += 0.1
+    assert cache.get("a", "gone") == "gone"
+    assert len(cache) == 0
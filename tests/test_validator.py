@@ -0,0 +1,100 @@
+"""Tests for AsyncAPIKeyValidator."""
+
+import asyncio
+import hashlib
+import hmac
+
+import pytest
+
+from core import AsyncAPIKeyValidator, InvalidSignatureError
+
+
+def _sign(key: str, secret: str) -> str:
+    return hmac.new(secret.encode(), key.encode(), hashlib.sha256).hexdigest()
+
+
+def test_batch_validate_reports_malformed_entries_as_invalid():
+    validator = AsyncAPIKeyValidator()
+    validations = [
+        {"key": f"k{i}", "signature": _sign(f"k{i}", "s"), "secret": "s"}
+        for i in range(40)
+    ]
+    validations[3]["secret"] = b"s"  # pre-encoded secrets are accepted
+    validations[7]["signature"] = None  # malformed entry
+
+    try:
+        results = asyncio.run(validator.batch_validate(validations))
+    finally:
+        validator.close()
+
+    assert results == [i != 7 for i in range(40)]
+
+
+def test_batch_validate_process_pool_reports_malformed_entries():
+    validator = AsyncAPIKeyValidator(batch_threshold=32)
+    validations = [
+        {"key": f"k{i}", "signature": _sign(f"k{i}", "s"), "secret": "s"}
+        for i in range(40)
+    ]
+    validations[5]["signature"] = None
+
+    try:
+        results = asyncio.run(validator.batch_validate(validations))
+    finally:
+        validator.close()
+
+    assert results == [i != 5 for i in range(40)]
+
+
+def test_batch_validate_fail_fast_stops_at_first_failure():
+    calls = []
+
+    class CountingValidator(AsyncAPIKeyValidator):
+        async def validate(self, key, signature, secret, **kwargs):
+            calls.append(key)
+            return await super().validate(key, signature, secret, **kwargs)
+
+    validator = CountingValidator()
+    validations = [
+        {"key": f"k{i}", "signature": "00", "secret": "s"} for i in range(20)
+    ]
+
+    results = asyncio.run(
+        validator.batch_validate(validations, fail_fast=True)
+    )
+
+    assert results == [False] * 20
+    assert calls == ["k0"]
+
+
+def test_batch_validate_fail_fast_off_loop():
+    validator = AsyncAPIKeyValidator()
+    validations = [
+        {"key": f"k{i}", "signature": _sign(f"k{i}", "s"), "secret": "s"}
+        for i in range(200)
+    ]
+
+    try:
+        assert asyncio.run(
+            validator.batch_validate(validations, fail_fast=True)
+        ) == [True] * 200
+        validations[150]["signature"] = "00"
+        assert asyncio.run(
+            validator.batch_validate(validations, fail_fast=True)
+        ) == [False] * 200
+    finally:
+        validator.close()
+
+
+def test_validate_rejects_non_canonical_hex_signatures():
+    validator = AsyncAPIKeyValidator()
+    signature = _sign("k", "s")
+    assert asyncio.run(validator.validate("k", signature, "s"))
+
+    for variant in (
+        signature.upper(),
+        " ".join(signature[i:i + 2] for i in range(0, 64, 2)),
+        signature + " ",
+    ):
+        with pytest.raises(InvalidSignatureError):
+            asyncio.run(validator.validate("k", variant, "s"))
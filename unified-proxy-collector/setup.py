@@ -19,6 +19,9 @@ setup(
         "rich>=13.0.0",
         "colorama>=0.4.6"
     ],
+    extras_require={
+        "speedups": ["orjson>=3.9.0", "selectolax>=0.3.17", "lxml>=4.9.0", "brotli>=1.0.9", "requests-cache>=1.0.0"],
+    },
     python_requires=">=3.8",
     entry_points={
         "console_scripts": [
@@ -4,7 +4,7 @@ from unified_proxy_collector.core.tui.app import ProxyCollectorApp
 def main():
     parser = argparse.ArgumentParser(description="Unified Proxy Collector")
     parser.add_argument("--headless", action="store_true", help="Run in headless mode (no TUI)")
-    parser.add_argument("--workers", type=int, default=50, help="Number of threads (Headless only)")
+    parser.add_argument("--workers", type=int, default=None, help="Number of fetch threads (Headless only, default: auto)")
     parser.add_argument("--fetch-http", action="store_true", default=True)
     parser.add_argument("--fetch-telegram", action="store_true", default=True)
     parser.add_argument("--validate", action="store_true", default=True)
@@ -15,8 +15,8 @@ def main():
         # Run legacy CLI mode
         from rich.console import Console
         from rich.panel import Panel
-        from unified_proxy_collector.core.config import ConfigLoader
-        from unified_proxy_collector.core.fetcher import UnifiedFetcher
+        from unified_proxy_collector.core.config import get_config
+        from unified_proxy_collector.core.fetcher import UnifiedFetcher, normalize_channel_name
         from unified_proxy_collector.core.parser import ConfigParser
         from unified_proxy_collector.core.processor import Processor
         from unified_proxy_collector.core.validator import Validator
@@ -26,7 +26,7 @@ def main():
         console = Console()
         console.print(Panel.fit("Unified Proxy Collector (Headless)", style="bold green"))
 
-        config_loader = ConfigLoader()
+        config_loader = get_config()
         config = config_loader.config
 
         # Override config with args if needed
@@ -43,7 +43,7 @@ def main():
         telegram_channels = []
         try:
             with open(config["fetcher"]["sources"]["telegram_file"], "r") as f:
-                telegram_channels = json.load(f)
+                telegram_channels = [normalize_channel_name(c) for c in json.load(f)]
         except: pass
 
         fetcher = UnifiedFetcher(config)
@@ -51,7 +51,11 @@ def main():
 
         all_content = []
         for item in raw_data:
-            all_content.extend(item['content'])
+            content = item['content']
+            if isinstance(content, str): # HTTP body
+                all_content.append(content)
+            else: # Telegram messages
+                all_content.extend(content)
 
         parser = ConfigParser(config)
         extracted = parser.parse(all_content)
@@ -1,13 +1,31 @@
+import copy
 import json
 import yaml
+from collections import deque
+from functools import lru_cache
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # optional speedup, falls back to stdlib json
+    orjson = None
+
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:  # libyaml not available, use the pure-Python classes
+    from yaml import SafeLoader, SafeDumper
+
 class ConfigLoader:
     DEFAULT_CONFIG = {
         "fetcher": {
             "timeout": 20,
             "max_retries": 3,
-            "max_workers": 20,
+            "max_workers": None, # None = sized per run from the source count
+            "http_cache": { # Used when requests-cache is installed
+                "enabled": True,
+                "path": ".http_cache",
+                "expire_after": 600 # seconds
+            },
             "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
             "sources": {
                 "http_file": "data/sources/http_sources.txt",
@@ -21,11 +39,14 @@ class ConfigLoader:
         "processor": {
             "geoip_db": "data/geoip/GeoLite2-Country.mmdb",
             "deduplicate": True,
+            "workers": None, # None = one per CPU core
+            "parallel_threshold": 100000, # Min configs before using a process pool
             "filters": {
                 "allowed_countries": [], # Empty list = all allowed
                 "blocked_countries": ["IR", "CN", "RU"],
                 "allowed_protocols": [],
                 "min_score": 0,
+                "top_k": None, # Keep only the N best-scoring configs; None = all
                 "exclude_ports": []
             },
             "scoring": {
@@ -44,7 +65,7 @@ class ConfigLoader:
         "validator": {
             "enabled": True,
             "timeout": 2,
-            "max_workers": 50,
+            "max_concurrency": 500, # in-flight TCP probes
             "max_latency": 2000 # ms
         },
         "output": {
@@ -57,8 +78,16 @@ class ConfigLoader:
     }
 
     def __init__(self, config_path="config.yaml"):
-        self.config = self.DEFAULT_CONFIG.copy()
+        self.config = copy.deepcopy(self.DEFAULT_CONFIG)
         self.config_path = config_path
+        self._loaded_mtimes = {}
+        self.load()
+
+    def reload(self):
+        """Re-reads the config from disk in place, starting from the defaults."""
+        self.config.clear()
+        self.config.update(copy.deepcopy(self.DEFAULT_CONFIG))
+        self._loaded_mtimes.clear()
         self.load()
 
     def load(self):
@@ -78,10 +107,20 @@ class ConfigLoader:
         elif path.suffix == '.json':
             self._load_from_json(path)
 
+    def _is_unchanged(self, path):
+        """True if path was already loaded and has not been modified since."""
+        mtime = path.stat().st_mtime_ns
+        if self._loaded_mtimes.get(path) == mtime:
+            return True
+        self._loaded_mtimes[path] = mtime
+        return False
+
     def _load_from_yaml(self, path):
         try:
+            if self._is_unchanged(path):
+                return
             with open(path, 'r') as f:
-                loaded = yaml.safe_load(f)
+                loaded = yaml.load(f, Loader=SafeLoader)
                 if loaded:
                     self._merge(self.config, loaded)
         except Exception as e:
@@ -89,20 +128,29 @@ class ConfigLoader:
 
     def _load_from_json(self, path):
         try:
-            with open(path, 'r') as f:
-                loaded = json.load(f)
-                if loaded:
-                    self._merge(self.config, loaded)
+            if self._is_unchanged(path):
+                return
+            if orjson is not None:
+                with open(path, 'rb') as f:
+                    loaded = orjson.loads(f.read())
+            else:
+                with open(path, 'r') as f:
+                    loaded = json.load(f)
+            if loaded:
+                self._merge(self.config, loaded)
         except Exception as e:
             print(f"Error loading JSON config: {e}")
 
     def _merge(self, base, update):
-        """Recursively merge update dict into base dict."""
-        for k, v in update.items():
-            if k in base and isinstance(base[k], dict) and isinstance(v, dict):
-                self._merge(base[k], v)
-            else:
-                base[k] = v
+        """Deep-merge update dict into base dict (iteratively, no recursion)."""
+        stack = deque([(base, update)])
+        while stack:
+            b, u = stack.popleft()
+            for k, v in u.items():
+                if isinstance(v, dict) and isinstance(b.get(k), dict):
+                    stack.append((b[k], v))
+                else:
+                    b[k] = v
 
     def save(self):
         """Saves current config to file."""
@@ -110,7 +158,7 @@ class ConfigLoader:
         try:
             with open(path, 'w') as f:
                 if path.suffix in ['.yaml', '.yml']:
-                    yaml.dump(self.config, f, default_flow_style=False)
+                    yaml.dump(self.config, f, Dumper=SafeDumper, default_flow_style=False)
                 else:
                     json.dump(self.config, f, indent=4)
         except Exception as e:
@@ -123,3 +171,9 @@ class ConfigLoader:
         if key is None:
             return self.config[section]
         return self.config[section].get(key)
+
+
+@lru_cache(maxsize=None)
+def get_config(config_path="config.yaml"):
+    """Returns the shared ConfigLoader for config_path, parsing it only once per process."""
+    return ConfigLoader(config_path)
@@ -1,75 +1,251 @@
 import requests
-import time
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
+from urllib3.util.retry import Retry
 import concurrent.futures
 import logging
-from bs4 import BeautifulSoup
+import re
+import threading
+import time
+from itertools import zip_longest
+from types import MappingProxyType
+from bs4 import BeautifulSoup, SoupStrainer
 from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn, TimeRemainingColumn
 from rich.console import Console
 
+from unified_proxy_collector.core.parser import SCHEME_TO_PROTOCOL
+
+try:
+    import requests_cache
+except ImportError:  # optional speedup, falls back to an uncached Session
+    requests_cache = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # optional speedup, falls back to BeautifulSoup
+    LexborHTMLParser = None
+
+# lxml parses in libxml2 C code; it is also bs4's faster tree builder
+try:
+    from lxml import etree
+    BS4_FEATURES = "lxml"
+except ImportError:  # optional speedup, falls back to the stdlib parser
+    etree = None
+    BS4_FEATURES = "html.parser"
+
+# Raw-bytes prefilter for Telegram pages: drop the markup, then pick config
+# links out directly (the parser still validates and cleans each one)
+TAG_PATTERN = re.compile(rb"<[^>]+>")
+LINK_PATTERN = re.compile(
+    rb"(?<![\w-])(?:" + b"|".join(s.encode() for s in SCHEME_TO_PROTOCOL) + rb")://[^\s<>]+",
+    re.IGNORECASE,
+)
+
+# Message bodies on a t.me/s/ page (class-token match, like the CSS selector)
+MESSAGE_XPATH = "//div[contains(concat(' ', normalize-space(@class), ' '), ' tgme_widget_message_text ')]"
+
+# lxml parsers can't be shared between threads, so each fetch thread keeps one
+_lxml_local = threading.local()
+
+def _lxml_parser():
+    parser = getattr(_lxml_local, "parser", None)
+    if parser is None:
+        parser = _lxml_local.parser = etree.HTMLParser(recover=True)
+    return parser
+
+# Only message bodies are needed, so bs4 builds nothing else from the page
+MESSAGE_STRAINER = SoupStrainer("div", attrs={"class": "tgme_widget_message_text"})
+
+# Decompressed bodies past this size are truncated (at a line boundary)
+# instead of downloaded and parsed whole
+MAX_RESPONSE_BYTES = 4 << 20
+READ_CHUNK_SIZE = 1 << 16
+
+# urllib3 decodes Brotli bodies (~20% smaller than gzip) only when brotli or
+# brotlicffi is installed, so only advertise it then
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = "br, gzip, deflate"
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        ACCEPT_ENCODING = "br, gzip, deflate"
+    except ImportError:  # optional speedup, falls back to gzip/deflate
+        ACCEPT_ENCODING = "gzip, deflate"
+
+# Headers shared by every fetcher session; User-Agent comes from config
+DEFAULT_HEADERS = MappingProxyType({
+    "Accept-Encoding": ACCEPT_ENCODING,
+    "Connection": "keep-alive",
+})
+
+# Fetching is pure I/O wait, which threads mask well (a process pool would
+# only add memory); beyond this many they mostly contend for the GIL.
+MAX_FETCH_WORKERS = 64
+
 logger = logging.getLogger("unified_proxy_collector")
 
+def _interleave_by_host(urls):
+    """
+    Orders urls round-robin across their hosts, so every host's connection
+    pool stays busy instead of one host's requests queueing back to back.
+    """
+    by_host = {}
+    for url in urls:
+        host = url.partition("://")[2].partition("/")[0]
+        by_host.setdefault(host, []).append(url)
+    return [url for group in zip_longest(*by_host.values()) for url in group if url is not None]
+
+def normalize_channel_name(entry):
+    """
+    Reduces a channel entry (username, @username or t.me URL) to the bare
+    username. Source loaders apply it once, so fetching just formats a URL.
+    """
+    name = entry.strip()
+    if "t.me/" in name:
+        name = name.split("t.me/", 1)[1]
+        if name.startswith("s/"):
+            name = name[2:]
+    return name.strip("/").lstrip("@")
+
 class UnifiedFetcher:
     def __init__(self, config):
         self.config = config.get("fetcher")
-        self.max_workers = self.config.get("max_workers", 20)
+        self.max_workers = self.config.get("max_workers") # None = auto
         self.timeout = self.config.get("timeout", 20)
         self.max_retries = self.config.get("max_retries", 3)
         self.user_agent = self.config.get("user_agent")
 
-        self.session = requests.Session()
-        self.session.headers.update({
-            "User-Agent": self.user_agent
-        })
+        self.session = self._make_session(self.config.get("http_cache", {}))
+        # Layered over requests' defaults, so e.g. "Accept: */*" is kept
+        self.session.headers.update(DEFAULT_HEADERS)
+        self.session.headers["User-Agent"] = self.user_agent
+        # Only transient failures (connection errors, 429, 5xx) are retried,
+        # with exponential backoff and honouring Retry-After.
+        retry = Retry(
+            total=self.max_retries,
+            backoff_factor=0.3,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["GET"]),
+            respect_retry_after_header=True
+        )
+        # The default pool keeps 10 connections per host, fewer than the worker
+        # threads; size it to the pool so keep-alive connections get reused.
+        pool_size = self.max_workers or MAX_FETCH_WORKERS
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size * 2,
+            max_retries=retry
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
         self.console = Console()
 
+    def _make_session(self, cache_config):
+        """
+        Sources mostly return the same body run after run, so with requests-cache
+        installed responses are kept in sqlite and revalidated with
+        If-None-Match / If-Modified-Since; a 304 skips the download.
+        """
+        if requests_cache is None or not cache_config.get("enabled", True):
+            return requests.Session()
+        return requests_cache.CachedSession(
+            cache_name=cache_config.get("path", ".http_cache"),
+            backend="sqlite",
+            expire_after=cache_config.get("expire_after", 600)
+        )
+
     def fetch_url_with_retry(self, url):
-        for attempt in range(self.max_retries):
-            try:
-                response = self.session.get(url, timeout=self.timeout)
+        """
+        Returns the (decompressed) response body as bytes, capped at
+        MAX_RESPONSE_BYTES, or None on failure.
+        Retries happen inside the adapter (see the Retry policy in __init__).
+
+        Note: with requests-cache active, the CachedSession reads the whole
+        body to store it, so the cap then bounds parsing but not memory.
+        """
+        body = bytearray()
+        truncated = False
+        try:
+            with self.session.get(url, timeout=self.timeout, stream=True) as response:
                 response.raise_for_status()
-                return response.text
-            except requests.RequestException as e:
-                logger.debug(f"Attempt {attempt + 1} failed for {url}: {e}")
-                if attempt < self.max_retries - 1:
-                    time.sleep(1)
-                continue
-        logger.warning(f"Failed to fetch {url} after {self.max_retries} attempts")
-        return None
+                # iter_content yields decoded chunks, so the cap counts
+                # decompressed bytes on urllib3 1.x and 2.x alike
+                for chunk in response.iter_content(chunk_size=READ_CHUNK_SIZE):
+                    body += chunk
+                    if len(body) > MAX_RESPONSE_BYTES:
+                        truncated = True
+                        break
+        except (requests.RequestException, Urllib3HTTPError) as e:
+            logger.warning(f"Failed to fetch {url}: {e}")
+            return None
+
+        if truncated:
+            # Cut back to the last full line so no half link reaches the parser;
+            # single-line bodies (e.g. base64 subscriptions) are cut at the cap
+            last_newline = body.rfind(b"\n", 0, MAX_RESPONSE_BYTES)
+            del body[last_newline + 1 if last_newline != -1 else MAX_RESPONSE_BYTES:]
+            logger.warning(f"Response from {url} exceeded {MAX_RESPONSE_BYTES} bytes; truncated")
+        return bytes(body)
 
     def fetch_telegram_channel(self, channel_name):
         """
         Scrapes a Telegram channel's web preview (t.me/s/...)
         Returns a list of message texts.
         """
-        # Support full URL or just username
-        if channel_name.startswith("http"):
-            url = channel_name
-            if "t.me/s/" not in url and "t.me/" in url:
-                url = url.replace("t.me/", "t.me/s/")
-        else:
-            url = f"https://t.me/s/{channel_name}"
-
-        html_content = self.fetch_url_with_retry(url)
+        html_content = self.fetch_url_with_retry(f"https://t.me/s/{channel_name}")
         if not html_content:
             return []
 
+        # Usually the links can be read straight off the page bytes; the DOM
+        # is only parsed when that finds none.
+        links = LINK_PATTERN.findall(TAG_PATTERN.sub(b" ", html_content))
+        if links:
+            return [link.decode("utf-8", errors="replace") for link in links]
+
+        if LexborHTMLParser is not None:
+            try:
+                # Lexbor builds the tree in C, far cheaper than bs4 on big pages
+                tree = LexborHTMLParser(html_content)
+                return [
+                    node.text(separator="\n")
+                    for node in tree.css("div.tgme_widget_message_text")
+                ]
+            except Exception:
+                pass # retry below with lxml / bs4
+
+        if etree is not None:
+            try:
+                # Straight libxml2 tree + XPath, no bs4 wrapper object per node
+                root = etree.fromstring(html_content, _lxml_parser())
+                return ["\n".join(el.itertext()) for el in root.xpath(MESSAGE_XPATH)]
+            except Exception:
+                pass # retry below with bs4
+
         try:
-            soup = BeautifulSoup(html_content, "html.parser") # bs4 handles html/xml/xhtml
-            messages = soup.find_all("div", class_="tgme_widget_message_text")
-            extracted_texts = []
-            for msg in messages:
-                text = msg.get_text(separator="\n")
-                extracted_texts.append(text)
-            return extracted_texts
+            soup = BeautifulSoup(html_content, BS4_FEATURES, parse_only=MESSAGE_STRAINER) # bs4 handles html/xml/xhtml
+            # Join the text nodes directly; same result as get_text(separator="\n")
+            return ["\n".join(msg.strings) for msg in soup.children]
         except Exception:
             return []
 
+    def worker_count(self, total_tasks):
+        """Fetch threads for a run: the configured max_workers, else ~4*sqrt(tasks) capped at MAX_FETCH_WORKERS."""
+        if self.max_workers:
+            return self.max_workers
+        return max(1, min(MAX_FETCH_WORKERS, int(4 * total_tasks ** 0.5)))
+
     def fetch_all(self, telegram_channels, http_sources):
         """
         Fetches data from both Telegram channels and HTTP sources concurrently.
         """
         results = []
 
+        # Fetch every distinct URL / channel once (channel names come
+        # normalized from the source loaders, see normalize_channel_name)
+        http_sources = list(dict.fromkeys(http_sources))
+        telegram_channels = list(dict.fromkeys(telegram_channels))
+
         total_tasks = len(telegram_channels) + len(http_sources)
         if total_tasks == 0:
             return []
@@ -84,21 +260,17 @@ class UnifiedFetcher:
         ) as progress:
             task_id = progress.add_task("Fetching sources...", total=total_tasks)
 
-            with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                # Submit HTTP tasks
-                http_futures = {
-                    executor.submit(self.fetch_url_with_retry, url): ("http", url)
-                    for url in http_sources
-                }
-
-                # Submit Telegram tasks
-                tg_futures = {
-                    executor.submit(self.fetch_telegram_channel, channel): ("telegram", channel)
-                    for channel in telegram_channels
-                }
-
-                futures = {**http_futures, **tg_futures}
+            with concurrent.futures.ThreadPoolExecutor(max_workers=self.worker_count(total_tasks)) as executor:
+                # Submit HTTP and Telegram tasks into one future -> source map
+                futures = {}
+                for url in _interleave_by_host(http_sources):
+                    futures[executor.submit(self.fetch_url_with_retry, url)] = ("http", url)
+                for channel in telegram_channels:
+                    futures[executor.submit(self.fetch_telegram_channel, channel)] = ("telegram", channel)
 
+                # Repaint the bar every 10 completions or 0.1s, not per future
+                done = 0
+                last_update = time.monotonic()
                 for future in concurrent.futures.as_completed(futures):
                     source_type, source = futures[future]
                     try:
@@ -107,13 +279,22 @@ class UnifiedFetcher:
                             if source_type == "http":
                                 # Determine if it's XML/Json/HTML?
                                 # For now, just pass content. The Parser will handle types.
-                                results.append({"type": "http", "source": source, "content": [data]})
+                                # Proxy lists are plain ASCII/UTF-8 text
+                                text = data.decode("utf-8", errors="replace")
+                                # One body per HTTP source, passed as a str (not a 1-item list)
+                                results.append({"type": "http", "source": source, "content": text})
                             else:
                                 if isinstance(data, list) and data:
                                      results.append({"type": "telegram", "source": source, "content": data})
                     except Exception:
                         pass
                     finally:
-                        progress.update(task_id, advance=1)
+                        done += 1
+                        now = time.monotonic()
+                        if done % 10 == 0 or now - last_update >= 0.1:
+                            progress.update(task_id, completed=done)
+                            last_update = now
+
+                progress.update(task_id, completed=done)
 
         return results
@@ -1,8 +1,22 @@
 import os
+import heapq
 import json
 import yaml
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # optional speedup, falls back to stdlib json
+    orjson = None
+
+try:
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:  # libyaml not available, use the pure-Python dumper
+    from yaml import SafeDumper
+
+# Per-file write buffer; one file stays open per protocol and per country
+TXT_BUFFER_SIZE = 1 << 16
+
 class OutputManager:
     def __init__(self, config):
         self.config = config.get("output")
@@ -31,6 +45,11 @@ class OutputManager:
             "total_count": len(configs),
             "items": configs
         }
+        if orjson is not None:
+            with open(filepath, "wb") as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            return
+
         with open(filepath, "w", encoding="utf-8") as f:
             json.dump(data, f, indent=2, ensure_ascii=False)
 
@@ -42,12 +61,11 @@ class OutputManager:
             "items": configs
         }
         with open(filepath, "w", encoding="utf-8") as f:
-            yaml.dump(data, f, default_flow_style=False, allow_unicode=True)
+            yaml.dump(data, f, Dumper=SafeDumper, default_flow_style=False, allow_unicode=True)
 
     def _save_best_of(self, configs):
-        # Sort by score descending
-        sorted_configs = sorted(configs, key=lambda x: x.get('score', 0), reverse=True)
-        top_n = sorted_configs[:self.best_of_limit]
+        # Top N by score descending, without sorting the whole list
+        top_n = heapq.nlargest(self.best_of_limit, configs, key=lambda x: x.get('score', 0))
 
         filepath = os.path.join(self.output_dir, "best_proxies.txt")
         with open(filepath, "w", encoding="utf-8") as f:
@@ -64,27 +82,23 @@ class OutputManager:
         os.makedirs(protocols_dir, exist_ok=True)
         os.makedirs(countries_dir, exist_ok=True)
 
-        by_proto = {}
-        by_country = {}
-
-        for item in configs:
-            proto = item.get('info', {}).get('protocol', 'unknown')
-            country = item.get('info', {}).get('country', 'NA')
-
-            if proto not in by_proto: by_proto[proto] = []
-            by_proto[proto].append(item['config'])
-
-            if country not in by_country: by_country[country] = []
-            by_country[country].append(item['config'])
-
-        # Save Protocols
-        for proto, items in by_proto.items():
-            path = os.path.join(protocols_dir, f"{proto}.txt")
-            with open(path, "w", encoding="utf-8") as f:
-                f.write("\n".join(items))
+        # Stream each config straight into its protocol and country files,
+        # opening every file lazily on first use.
+        handles = {}
+        try:
+            for item in configs:
+                info = item.get('info', {})
+                line = item['config'].encode("utf-8") + b"\n"
 
-        # Save Countries
-        for country, items in by_country.items():
-            path = os.path.join(countries_dir, f"{country}.txt")
-            with open(path, "w", encoding="utf-8") as f:
-                f.write("\n".join(items))
+                for directory, name in (
+                    (protocols_dir, info.get('protocol', 'unknown')),
+                    (countries_dir, info.get('country', 'NA')),
+                ):
+                    handle = handles.get((directory, name))
+                    if handle is None:
+                        path = os.path.join(directory, f"{name}.txt")
+                        handle = handles[(directory, name)] = open(path, "wb", buffering=TXT_BUFFER_SIZE)
+                    handle.write(line)
+        finally:
+            for handle in handles.values():
+                handle.close()
@@ -1,24 +1,41 @@
 import re
 import html
 
+# URL scheme -> canonical protocol name used in config/filters
+SCHEME_TO_PROTOCOL = {
+    'vmess': 'vmess',
+    'vless': 'vless',
+    'ss': 'shadowsocks',
+    'trojan': 'trojan',
+    'tuic': 'tuic',
+    'hysteria': 'hysteria',
+    'hy2': 'hysteria2',
+    'juicity': 'juicity',
+    'wireguard': 'wireguard',
+    'ssh': 'ssh',
+}
+
+# One fused pattern for every protocol, so each text is scanned once.
+# vless links with security=reality are matched here too (reality is vless).
+CONFIG_PATTERN = re.compile(
+    r"(?<![\w-])(?P<proto>" + "|".join(SCHEME_TO_PROTOCOL) + r")://[^\s<>#]+",
+    re.IGNORECASE,
+)
+
 class ConfigParser:
     def __init__(self, config):
         self.config = config.get("parser")
         self.allowed_protocols = self.config.get("protocols", [])
+        self.allowed_set = frozenset(self.allowed_protocols)
+        if 'reality' in self.allowed_set:
+            # "reality" is technically vless but often treated separately.
+            self.allowed_set |= {'vless'}
 
-        # Regex patterns covering all requested protocols + new ones
-        self.patterns = {
-            'vmess': r"(?<![\w-])(vmess://[^\s<>#]+)",
-            'vless': r"(?<![\w-])(vless://(?:(?!=reality)[^\s<>#])+(?=[\s<>#]))",
-            'reality': r"(?<![\w-])(vless://[^\s<>#]+?security=reality[^\s<>#]*)",
-            'shadowsocks': r"(?<![\w-])(ss://[^\s<>#]+)",
-            'trojan': r"(?<![\w-])(trojan://[^\s<>#]+)",
-            'tuic': r"(?<![\w-])(tuic://[^\s<>#]+)",
-            'hysteria': r"(?<![\w-])(hysteria://[^\s<>#]+)",
-            'hysteria2': r"(?<![\w-])(hy2://[^\s<>#]+)",
-            'juicity': r"(?<![\w-])(juicity://[^\s<>#]+)",
-            'wireguard': r"(?<![\w-])(wireguard://[^\s<>#]+)",
-            'ssh': r"(?<![\w-])(ssh://[^\s<>#]+)"
+        # Schemes to keep, mapped to their canonical protocol name
+        self.allowed_schemes = {
+            scheme: protocol
+            for scheme, protocol in SCHEME_TO_PROTOCOL.items()
+            if not self.allowed_set or protocol in self.allowed_set
         }
 
     def parse(self, content_list):
@@ -26,32 +43,31 @@ class ConfigParser:
         Parses a list of text content (messages or file lines) and extracts config links.
         Returns a list of unique config strings.
         """
-        extracted_configs = []
+        extracted_configs = set()
 
         for text in content_list:
             if not text:
                 continue
 
-            # Universal cleanup: unescape HTML entities (covers HTML/XML/XHTML sources)
-            text = html.unescape(text)
+            # Universal cleanup: unescape HTML entities (covers HTML/XML/XHTML sources).
+            # Plain-text sources have no entities, so skip the extra copy for them.
+            if '&' in text:
+                text = html.unescape(text)
 
-            for protocol, pattern in self.patterns.items():
-                # Check if protocol is enabled in config
-                if self.allowed_protocols and protocol not in self.allowed_protocols and protocol != "reality":
-                     # "reality" is technically vless but often treated separately.
-                     # If vless is allowed, reality usually implies vless.
-                     if protocol == "reality" and "vless" not in self.allowed_protocols:
-                         continue
-                     elif protocol != "reality":
-                         continue
+            # Every link contains "://"; one C substring search rules out
+            # texts without any before the regex scans them.
+            if "://" not in text:
+                continue
 
-                matches = re.findall(pattern, text, re.IGNORECASE)
-                for match in matches:
-                    clean_match = self._cleanup_match(match, protocol)
-                    if clean_match:
-                        extracted_configs.append(clean_match)
+            for match in CONFIG_PATTERN.finditer(text):
+                protocol = self.allowed_schemes.get(match.group('proto').lower())
+                if protocol is None:
+                    continue
+                clean_match = self._cleanup_match(match.group(0), protocol)
+                if clean_match:
+                    extracted_configs.add(clean_match)
 
-        return list(set(extracted_configs))
+        return list(extracted_configs)
 
     def _cleanup_match(self, match, protocol):
         # Remove trailing hash/remarks temporarily for cleaner normalization
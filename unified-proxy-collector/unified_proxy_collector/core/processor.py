@@ -1,9 +1,75 @@
 import geoip2.database
+import geoip2.errors
+import heapq
 import re
-import urllib.parse
 import os
 import json
-import base64
+import binascii
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # optional speedup, falls back to stdlib json
+    _json_loads = json.loads
+
+from unified_proxy_collector.core.parser import SCHEME_TO_PROTOCOL
+
+# IPv4 address, optionally followed by ":port"
+IP_PATTERN = re.compile(r"\b((?:\d{1,3}\.){3}\d{1,3})(?::(\d{1,5}))?\b")
+
+# Per-worker Processor (with its own GeoIP reader) used by the process pool
+_worker_processor = None
+
+def _init_worker(config):
+    global _worker_processor
+    _worker_processor = Processor(config)
+
+def _process_one(config_str):
+    return _worker_processor.process_one(config_str)
+
+def _split_authority(rest):
+    """
+    Splits the part after "scheme://" into (host, port).
+    Returns (None, None) if it doesn't look like [userinfo@]host:port.
+    """
+    authority = rest.partition("?")[0].partition("#")[0].partition("/")[0]
+    hostport = authority.rpartition("@")[2]
+    host, sep, port = hostport.rpartition(":")
+    if not sep or not host or not port.isdigit():
+        return None, None
+    if host.startswith("[") and host.endswith("]"):
+        host = host[1:-1] # IPv6 literal
+    return host, port
+
+def _dedup_key(config_str):
+    """
+    Returns the key under which configs count as the same proxy: the config
+    without its #remark and with its query params in sorted order.
+    Userinfo (UUID/password), sni, host and path all stay in the key, so
+    configs fronted by the same CDN host:port are not merged.
+    """
+    head, sep, query = config_str.partition("#")[0].partition("?")
+    if not sep:
+        return head
+    return head + "?" + "&".join(sorted(query.split("&")))
+
+def _open_geoip_reader(path):
+    """
+    Opens the GeoIP database memory-mapped through the maxminddb C extension,
+    or through the pure Python reader if the extension isn't built.
+    Returns None if there is no database file.
+    """
+    try:
+        try:
+            return geoip2.database.Reader(path, mode=geoip2.database.MODE_MMAP_EXT)
+        except ValueError: # maxminddb C extension not available
+            return geoip2.database.Reader(path, mode=geoip2.database.MODE_MMAP)
+    except FileNotFoundError:
+        return None
 
 class Processor:
     def __init__(self, config):
@@ -12,66 +78,121 @@ class Processor:
         self.reader = None
         self.dedup_enabled = self.config.get("deduplicate", True)
         self.filters = self.config.get("filters", {})
+        # Filter sets built once for O(1) membership tests per config
+        self._allowed_countries = frozenset(self.filters.get("allowed_countries", []))
+        self._blocked_countries = frozenset(self.filters.get("blocked_countries", []))
+        self._allowed_protocols = frozenset(self.filters.get("allowed_protocols", []))
+        self._exclude_ports = frozenset(int(p) for p in self.filters.get("exclude_ports", []))
+        self._min_score = self.filters.get("min_score", 0)
+        self._top_k = self.filters.get("top_k")
         self.score_weights = self.config.get("scoring", {}).get("weights", {})
+        # Weights read by calculate_score for every config, resolved once
+        self._w_sec = self.score_weights.get("security", 0)
+        self._w_sni = self.score_weights.get("sni", 0)
+        self._w_alpn = self.score_weights.get("alpn", 0)
+        self._w_flow = self.score_weights.get("flow", 0)
+        self.workers = self.config.get("workers") or os.cpu_count() or 1
+        self.parallel_threshold = self.config.get("parallel_threshold", 100000)
 
-        try:
-            if os.path.exists(self.geoip_db_path):
-                self.reader = geoip2.database.Reader(self.geoip_db_path)
-        except Exception as e:
-            pass
+        # Many configs share an IP; remember lookups instead of walking the MMDB tree again
+        self._country_for_ip = lru_cache(maxsize=65536)(self._lookup_country)
+
+        # Each process opens its own reader (pool workers build their own Processor)
+        self.reader = _open_geoip_reader(self.geoip_db_path)
 
     def process(self, configs):
+        processed_configs = self._iter_processed(configs)
+
+        # 5. Collapse copies of the same config (they often differ only in
+        # the #remark or query param order), keeping the best-scoring one
+        if self.dedup_enabled:
+            best = {}
+            for item in processed_configs:
+                key = _dedup_key(item['config'])
+                kept = best.get(key)
+                if kept is None or item['score'] > kept['score']:
+                    best[key] = item
+            processed_configs = best.values()
+
+        # 6. Sort (Default by score); with a top_k cap only the best k are kept
+        if self._top_k:
+            return heapq.nlargest(self._top_k, processed_configs, key=itemgetter('score'))
+        return sorted(processed_configs, key=itemgetter('score'), reverse=True)
+
+    def _iter_processed(self, configs):
+        """Yields the configs that survive enrichment, filtering and scoring."""
         # 1. Deduplicate
         if self.dedup_enabled:
-            unique_configs = list(set(configs))
+            # dict.fromkeys dedups in C and keeps first-seen order
+            unique_configs = dict.fromkeys(configs)
         else:
             unique_configs = configs
 
-        processed_configs = []
+        # 2-4. Enrich, filter and score; items are independent, so large
+        # batches are spread over a process pool (order is kept for stable ties).
+        # Workers are spawned, not forked: the TUI calls this from a thread of a
+        # multithreaded process, and workers rebuild their Processor from config anyway.
+        # Spawning re-imports geoip2 etc. in every worker (~1 s) while a config
+        # takes ~20 us serially, so the pool only pays off for ~100k+ configs.
+        # ProcessPoolExecutor raises BrokenProcessPool if a worker can't start,
+        # where multiprocessing.Pool would keep respawning it forever.
+        if self.workers > 1 and len(unique_configs) >= self.parallel_threshold:
+            with ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=({"processor": self.config},),
+            ) as pool:
+                for item in pool.map(_process_one, unique_configs, chunksize=256):
+                    if item is not None:
+                        yield item
+        else:
+            for config in unique_configs:
+                item = self.process_one(config)
+                if item is not None:
+                    yield item
 
-        for config in unique_configs:
-            # 2. Enrich & Parse details
-            info = self.enrich(config)
+    def process_one(self, config):
+        """Enriches, filters and scores one config. Returns None if filtered out."""
+        # 2. Enrich & Parse details
+        info = self.enrich(config)
 
-            # 3. Filter
-            if self._is_filtered(info):
-                continue
+        # Without an endpoint the config can be neither validated nor used
+        if not info["ip"] or not info["port"]:
+            return None
 
-            # 4. Score
-            score = self.calculate_score(config, info)
+        # 3. Filter
+        if self._is_filtered(info):
+            return None
 
-            processed_configs.append({
-                "config": config,
-                "info": info,
-                "score": score,
-                "latency": None # Placeholder for validator
-            })
+        # 4. Score
+        score = self.calculate_score(config, info)
+        if score < self._min_score:
+            return None
 
-        # 5. Sort (Default by score)
-        processed_configs.sort(key=lambda x: x['score'], reverse=True)
-        return processed_configs
+        return {
+            "config": config,
+            "info": info,
+            "score": score,
+            "latency": None # Placeholder for validator
+        }
 
     def _is_filtered(self, info):
         """Returns True if config should be dropped based on filters."""
-        allowed_countries = self.filters.get("allowed_countries", [])
-        blocked_countries = self.filters.get("blocked_countries", [])
-        allowed_protocols = self.filters.get("allowed_protocols", [])
-        min_score = self.filters.get("min_score", 0)
-        exclude_ports = self.filters.get("exclude_ports", [])
-
         # Country filter
         country = info.get("country", "NA")
-        if allowed_countries and country not in allowed_countries:
+        if self._allowed_countries and country not in self._allowed_countries:
             return True
-        if country in blocked_countries:
+        if country in self._blocked_countries:
             return True
 
         # Protocol filter
-        if allowed_protocols and info.get("protocol") not in allowed_protocols:
+        if self._allowed_protocols and info.get("protocol") not in self._allowed_protocols:
             return True
 
         # Port filter
-        if info.get("port") and int(info.get("port")) in exclude_ports:
+        port = info.get("port")
+        if self._exclude_ports and port and int(port) in self._exclude_ports:
             return True
 
         return False
@@ -85,47 +206,57 @@ class Processor:
             "security": "unknown"
         }
 
-        # Determine protocol
-        if config_str.startswith("vmess://"): info["protocol"] = "vmess"
-        elif config_str.startswith("vless://"): info["protocol"] = "vless"
-        elif config_str.startswith("ss://"): info["protocol"] = "shadowsocks"
-        elif config_str.startswith("trojan://"): info["protocol"] = "trojan"
-        elif config_str.startswith("tuic://"): info["protocol"] = "tuic"
-        elif config_str.startswith("hysteria://"): info["protocol"] = "hysteria"
-        elif config_str.startswith("hy2://"): info["protocol"] = "hysteria2"
-        elif config_str.startswith("wireguard://"): info["protocol"] = "wireguard"
-        elif config_str.startswith("ssh://"): info["protocol"] = "ssh"
-
-        # Try to extract IP/Port
-        # Simplified logic. For full "Universality", we should strictly parse each proto.
-        # But regex for IP is 90% effective for enrichment.
-
-        ip_match = re.search(r"\b(?:\d{1,3}\.){3}\d{1,3}\b", config_str)
-        if ip_match:
-            info["ip"] = ip_match.group(0)
+        # Determine protocol (one scan for the scheme, one dict lookup)
+        scheme, sep, rest = config_str.partition("://")
+        if sep:
+            info["protocol"] = SCHEME_TO_PROTOCOL.get(scheme.lower(), "unknown")
+
+        # Try to extract IP/Port from the URL authority ([userinfo@]host:port).
+        # vmess carries them in its base64 JSON body instead (handled below).
+        if sep and info["protocol"] != "vmess":
+            host, port = _split_authority(rest)
+            if host:
+                info["ip"] = host
+                info["port"] = port
+
+        # Fallback: first IPv4-looking token (and its port) anywhere in the config
+        if info["ip"] is None:
+            ip_match = IP_PATTERN.search(config_str)
+            if ip_match:
+                info["ip"], info["port"] = ip_match.groups()
 
         # If vmess, decode json to get IP/Port/Security accurately
         if info["protocol"] == "vmess":
             try:
-                b64 = config_str.replace("vmess://", "")
-                decoded = base64.b64decode(b64).decode("utf-8", errors="ignore")
-                data = json.loads(decoded)
-                info["ip"] = data.get("add")
-                info["port"] = data.get("port")
+                # Pad once and decode straight to bytes; both JSON parsers take bytes
+                raw = binascii.a2b_base64(rest + "=" * (-len(rest) % 4))
+                data = _json_loads(raw)
+                # The body is untrusted: only take a string host and an
+                # int-like port (a list "add" would break the GeoIP cache)
+                add = data.get("add")
+                port = data.get("port")
+                if isinstance(port, int) and not isinstance(port, bool):
+                    port = str(port)
+                if isinstance(add, str) and isinstance(port, str) and port.isdigit():
+                    info["ip"] = add
+                    info["port"] = port
                 info["security"] = data.get("tls", "none")
-            except:
+            except (binascii.Error, ValueError, UnicodeDecodeError, AttributeError):
                 pass
 
         # GeoIP
         if info["ip"] and self.reader:
-            try:
-                response = self.reader.country(info["ip"])
-                info["country"] = response.country.iso_code or "NA"
-            except:
-                pass
+            info["country"] = self._country_for_ip(info["ip"])
 
         return info
 
+    def _lookup_country(self, ip):
+        try:
+            response = self.reader.country(ip)
+            return response.country.iso_code or "NA"
+        except (geoip2.errors.AddressNotFoundError, ValueError):
+            return "NA"
+
     def calculate_score(self, profile, info):
         # Implementation of Project 2 scoring + Extra logic
         try:
@@ -134,22 +265,24 @@ class Processor:
             # Base score
             score += 1
 
-            # Security bonus
-            if "tls" in profile or info.get("security") == "tls":
-                score += self.score_weights.get("security", 0)
+            # Security bonus (vmess reports it in its JSON body, URI schemes as a param)
+            if info.get("security") == "tls" or "security=tls" in profile or "&tls=1" in profile:
+                score += self._w_sec
 
-            # Params parsing for other bonuses
-            if "?" in profile:
-                params_str = profile.split("?")[1].split("#")[0]
-                params = urllib.parse.parse_qs(params_str)
+            # Query params for other bonuses. Only presence matters, so plain
+            # substring checks replace parse_qs; the leading "&" anchors each
+            # key to a param boundary (so e.g. "xsni=" doesn't count as "sni=").
+            query = profile.partition("?")[2]
+            if query:
+                params = "&" + query.partition("#")[0]
 
-                if "sni" in params: score += self.score_weights.get("sni", 0)
-                if "alpn" in params: score += self.score_weights.get("alpn", 0)
-                if "flow" in params: score += self.score_weights.get("flow", 0)
-                if "fp" in params: score += 1
+                if "&sni=" in params: score += self._w_sni
+                if "&alpn=" in params: score += self._w_alpn
+                if "&flow=" in params: score += self._w_flow
+                if "&fp=" in params: score += 1
 
             return score
-        except:
+        except (ValueError, AttributeError):
             return 0
 
     def close(self):
@@ -4,14 +4,15 @@ from textual.widgets import Header, Footer, Button, Label, Checkbox, Input
 from textual.screen import ModalScreen
 from textual.binding import Binding
 import asyncio
+import json
 
 from unified_proxy_collector.core.tui.widgets import LogPanel, MetricsPanel, FailurePanel
-from unified_proxy_collector.core.fetcher import UnifiedFetcher
+from unified_proxy_collector.core.fetcher import UnifiedFetcher, normalize_channel_name
 from unified_proxy_collector.core.parser import ConfigParser
 from unified_proxy_collector.core.processor import Processor
 from unified_proxy_collector.core.validator import Validator
 from unified_proxy_collector.core.output import OutputManager
-from unified_proxy_collector.core.config import ConfigLoader
+from unified_proxy_collector.core.config import get_config
 
 class PreFlightModal(ModalScreen):
     """Configuration Dialog before start."""
@@ -51,7 +52,7 @@ class ProxyCollectorApp(App):
 
     def __init__(self):
         super().__init__()
-        self.config_loader = ConfigLoader()
+        self.config_loader = get_config()
         self.config = self.config_loader.config
         self.is_running = False
         self.worker_task = None
@@ -63,6 +64,11 @@ class ProxyCollectorApp(App):
         self.validator = Validator(self.config)
         self.output_manager = OutputManager(self.config)
 
+        # Source lists rarely change between runs, so read them once here
+        # rather than with blocking file I/O inside the scraping loop.
+        self._source_errors = []
+        self._http_sources, self._telegram_channels = self._load_sources()
+
         # State metrics
         self.metrics = {
             "fetched": 0,
@@ -71,6 +77,28 @@ class ProxyCollectorApp(App):
             "validated": 0
         }
 
+    def _load_sources(self):
+        sources = self.config["fetcher"]["sources"]
+
+        http_sources = []
+        try:
+            with open(sources["http_file"], "r") as f:
+                # dict.fromkeys drops duplicate URLs and keeps file order
+                http_sources = list(dict.fromkeys(
+                    l.strip() for l in f if l.strip() and not l.startswith("#")
+                ))
+        except Exception as e:
+            self._source_errors.append(str(e))
+
+        telegram_channels = []
+        try:
+            with open(sources["telegram_file"], "r") as f:
+                telegram_channels = [normalize_channel_name(c) for c in json.load(f)]
+        except Exception as e:
+            self._source_errors.append(str(e))
+
+        return http_sources, telegram_channels
+
     def compose(self) -> ComposeResult:
         yield Header(show_clock=True)
         with Container(id="main-layout"):
@@ -103,23 +131,12 @@ class ProxyCollectorApp(App):
 
     async def run_scraping_loop(self):
         """Main async orchestration loop."""
-        self.log_msg("Loading sources...")
-
-        # Load sources (Async simulation)
-        http_sources = []
-        try:
-            with open(self.config["fetcher"]["sources"]["http_file"], "r") as f:
-                http_sources = [l.strip() for l in f if l.strip() and not l.startswith("#")]
-        except Exception as e:
-            self.log_error("Load Sources", str(e))
-
-        telegram_channels = []
-        try:
-            with open(self.config["fetcher"]["sources"]["telegram_file"], "r") as f:
-                import json
-                telegram_channels = json.load(f)
-        except Exception as e:
-            self.log_error("Load Sources", str(e))
+        # Sources were read once at startup; report any load failures now
+        # that the panels exist.
+        for error in self._source_errors:
+            self.log_error("Load Sources", error)
+        http_sources = self._http_sources
+        telegram_channels = self._telegram_channels
 
         self.log_msg(f"Loaded {len(http_sources)} HTTP sources and {len(telegram_channels)} Channels.")
 
@@ -132,8 +149,11 @@ class ProxyCollectorApp(App):
 
         all_content = []
         for item in raw_data:
-            if "content" in item:
-                all_content.extend(item['content'])
+            content = item.get("content")
+            if isinstance(content, str): # HTTP body
+                all_content.append(content)
+            elif content: # Telegram messages
+                all_content.extend(content)
 
         self.metrics["fetched"] = len(all_content)
         self.update_metrics_ui()
@@ -161,8 +181,8 @@ class ProxyCollectorApp(App):
 
         # Validate
         self.log_msg("Initiating Validation Phase...")
-        # Validator is also threaded internally, so wrapping in thread is fine
-        validated_configs = await asyncio.to_thread(self.validator.validate_configs, processed_configs)
+        # Probes run concurrently on this event loop
+        validated_configs = await self.validator.validate_configs_async(processed_configs)
         self.metrics["validated"] = len(validated_configs)
         self.update_metrics_ui()
         self.log_msg(f"Validated {len(validated_configs)} functional proxies.")
@@ -180,10 +200,11 @@ class ProxyCollectorApp(App):
 
     def update_metrics_ui(self):
         panel = self.query_one("#metrics-panel", MetricsPanel)
-        panel.update_metric(0, self.metrics["fetched"], "")
-        panel.update_metric(1, self.metrics["parsed"], "")
-        panel.update_metric(2, self.metrics["unique"], "")
-        panel.update_metric(3, self.metrics["validated"], "")
+        with self.batch_update():
+            panel.update_metric(0, self.metrics["fetched"], "")
+            panel.update_metric(1, self.metrics["parsed"], "")
+            panel.update_metric(2, self.metrics["unique"], "")
+            panel.update_metric(3, self.metrics["validated"], "")
 
 if __name__ == "__main__":
     app = ProxyCollectorApp()
@@ -1,23 +1,55 @@
 from textual.widgets import RichLog, Static, DataTable
 from textual.app import ComposeResult
 from textual.containers import Vertical
+from textual.coordinate import Coordinate
 from rich.text import Text
+from collections import deque
+
+# Seconds between batched writes to a panel's RichLog
+LOG_FLUSH_INTERVAL = 0.05
 
 class PanelHeader(Static):
     """Header for a panel"""
     def __init__(self, title: str, id: str = None):
         super().__init__(title, id=id, classes="panel-title")
 
-class LogPanel(Vertical):
+class BufferedLogPanel(Vertical):
+    """
+    Panel around a RichLog that queues lines and writes them in one batch per
+    tick, so a burst of messages costs one refresh instead of one per line.
+    """
+    LOG_WIDGET_ID = None
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._pending = deque()
+        self._log_widget = None
+
+    def on_mount(self):
+        self._log_widget = self.query_one(f"#{self.LOG_WIDGET_ID}", RichLog)
+        self.set_interval(LOG_FLUSH_INTERVAL, self._flush)
+
+    def _write(self, text):
+        self._pending.append(text)
+
+    def _flush(self):
+        if not self._pending:
+            return
+        lines = Text("\n").join(self._pending)
+        self._pending.clear()
+        self._log_widget.write(lines)
+
+class LogPanel(BufferedLogPanel):
     """Left Panel: Real-time logs"""
+    LOG_WIDGET_ID = "log-widget"
+
     def compose(self) -> ComposeResult:
         yield PanelHeader("WORKFLOW LOGS", id="log-header")
         yield RichLog(id="log-widget", wrap=True, markup=True, highlight=True)
 
     def log(self, message, level="INFO"):
-        log_widget = self.query_one("#log-widget", RichLog)
         color = "green" if level == "INFO" else "yellow" if level == "WARNING" else "red"
-        log_widget.write(Text(f"[{level}] {message}", style=color))
+        self._write(Text(f"[{level}] {message}", style=color))
 
 class MetricsPanel(Vertical):
     """Center Panel: Success Metrics"""
@@ -26,7 +58,7 @@ class MetricsPanel(Vertical):
         yield DataTable(id="metrics-table")
 
     def on_mount(self):
-        table = self.query_one("#metrics-table", DataTable)
+        table = self._table = self.query_one("#metrics-table", DataTable)
         table.add_columns("Metric", "Value", "Delta")
         table.add_rows([
             ("Fetched Items", "0", "+0"),
@@ -38,16 +70,18 @@ class MetricsPanel(Vertical):
         ])
 
     def update_metric(self, row_idx, value, delta):
-        table = self.query_one("#metrics-table", DataTable)
-        table.update_cell_at(row_idx, 1, str(value))
-        table.update_cell_at(row_idx, 2, str(delta))
+        # One repaint for both cells
+        with self.app.batch_update():
+            self._table.update_cell_at(Coordinate(row_idx, 1), str(value))
+            self._table.update_cell_at(Coordinate(row_idx, 2), str(delta))
 
-class FailurePanel(Vertical):
+class FailurePanel(BufferedLogPanel):
     """Right Panel: Failure Diagnostics"""
+    LOG_WIDGET_ID = "failure-widget"
+
     def compose(self) -> ComposeResult:
         yield PanelHeader("FAILURE TAXONOMY", id="failure-header")
         yield RichLog(id="failure-widget", wrap=True, markup=True)
 
     def log_error(self, source, error):
-        log_widget = self.query_one("#failure-widget", RichLog)
-        log_widget.write(Text(f"[{source}] {error}", style="bold red"))
+        self._write(Text(f"[{source}] {error}", style="bold red"))
@@ -1,6 +1,5 @@
+import asyncio
 import socket
-import concurrent.futures
-import time
 from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn
 
 class Validator:
@@ -8,23 +7,37 @@ class Validator:
         self.config = config.get("validator")
         self.enabled = self.config.get("enabled", True)
         self.timeout = self.config.get("timeout", 2)
-        self.max_workers = self.config.get("max_workers", 50)
         self.max_latency = self.config.get("max_latency", 2000)
+        # Probes in flight at once; all of them are driven by one event loop thread
+        self.max_concurrency = self.config.get("max_concurrency", 500)
 
-    def validate_tcp(self, host, port):
+    async def probe_tcp(self, host, port):
+        """Returns the TCP connect latency to host:port in ms, or None if unreachable."""
+        # A bare non-blocking socket handed to the loop's selector is all a
+        # liveness probe needs; no transport or stream objects per probe.
+        loop = asyncio.get_running_loop()
+        family = socket.AF_INET6 if ':' in host else socket.AF_INET
+        sock = None
         try:
-            start_time = time.time()
-            sock = socket.create_connection((host, int(port)), timeout=self.timeout)
-            latency = (time.time() - start_time) * 1000
-            sock.close()
-            return latency
-        except (socket.timeout, ConnectionRefusedError, OSError):
-            return None
-        except Exception as e:
-            # Log unexpected errors if logging was set up in this module, or just return None
+            # Inside the try: running out of fds (EMFILE) fails this probe only
+            sock = socket.socket(family, socket.SOCK_STREAM)
+            sock.setblocking(False)
+            start_time = loop.time()
+            await asyncio.wait_for(loop.sock_connect(sock, (host, int(port))), timeout=self.timeout)
+            return (loop.time() - start_time) * 1000
+        except Exception:
+            # Scraped configs are untrusted (e.g. port 99999 raises OverflowError);
+            # one bad entry must not abort the whole run
             return None
+        finally:
+            if sock is not None:
+                sock.close()
 
     def validate_configs(self, processed_configs):
+        """Blocking entry point: runs validate_configs_async on a new event loop."""
+        return asyncio.run(self.validate_configs_async(processed_configs))
+
+    async def validate_configs_async(self, processed_configs):
         if not self.enabled:
             return processed_configs
 
@@ -38,47 +51,22 @@ class Validator:
         ) as progress:
             task = progress.add_task("Validating configs...", total=len(processed_configs))
 
-            with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                future_to_config = {}
-
-                for item in processed_configs:
-                    info = item.get('info', {})
-                    ip = info.get('ip')
-                    port = info.get('port')
-
-                    # Regex fallback for port if not extracted by Processor
-                    if (not port) and ip and item['config']:
-                        import re
-                        try:
-                            # Basic port extraction fallback
-                            match = re.search(f"{re.escape(ip)}:(\\d+)", item['config'])
-                            if match:
-                                port = match.group(1)
-                        except Exception:
-                            pass
+            # The Processor only emits configs with ip and port set. A fixed
+            # set of probe loops share one iterator, which bounds concurrency
+            # without creating a task per config up front.
+            pending = iter(processed_configs)
 
-                    if ip and port:
-                        future = executor.submit(self.validate_tcp, ip, port)
-                        future_to_config[future] = item
-                    else:
-                        # Can't validate without IP:Port.
-                        # If "Selectivity" demands robust error handling, we mark as -1 or discard.
-                        # Let's keep but mark invalid.
-                        item['latency'] = -1
-                        # validated_configs.append(item) # Optional: Don't append if strict
-                        progress.update(task, advance=1)
+            async def probe_loop():
+                for item in pending:
+                    info = item['info']
+                    latency = await self.probe_tcp(info['ip'], info['port'])
+                    if latency is not None and latency <= self.max_latency:
+                        item['latency'] = round(latency, 2)
+                        validated_configs.append(item)
+                    progress.update(task, advance=1)
 
-                for future in concurrent.futures.as_completed(future_to_config):
-                    item = future_to_config[future]
-                    try:
-                        latency = future.result()
-                        if latency is not None:
-                            if latency <= self.max_latency:
-                                item['latency'] = round(latency, 2)
-                                validated_configs.append(item)
-                    except:
-                        pass
-                    finally:
-                        progress.update(task, advance=1)
+            await asyncio.gather(*(
+                probe_loop() for _ in range(min(self.max_concurrency, len(processed_configs)))
+            ))
 
         return validated_configs
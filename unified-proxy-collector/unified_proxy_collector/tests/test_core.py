@@ -1,6 +1,8 @@
+import base64
 import unittest
-from unittest.mock import patch
-from unified_proxy_collector.core.config import ConfigLoader
+from unittest.mock import AsyncMock, MagicMock, patch
+from unified_proxy_collector.core.config import ConfigLoader, get_config
+from unified_proxy_collector.core.fetcher import MAX_RESPONSE_BYTES, UnifiedFetcher
 from unified_proxy_collector.core.parser import ConfigParser
 from unified_proxy_collector.core.processor import Processor
 from unified_proxy_collector.core.validator import Validator
@@ -23,6 +25,10 @@ class TestUnifiedCollector(unittest.TestCase):
         self.assertIsNotNone(self.config.get("fetcher"))
         self.assertEqual(self.config["fetcher"]["timeout"], 20)
 
+    def test_get_config_is_cached(self):
+        self.assertIs(get_config(), get_config())
+        self.assertEqual(get_config().config["fetcher"]["timeout"], 20)
+
     def test_parser(self):
         parser = ConfigParser(self.config)
         # Mock HTML content containing links
@@ -49,10 +55,33 @@ class TestUnifiedCollector(unittest.TestCase):
         # Base(1) + TLS(2) = 3 (weights in config)
         self.assertGreaterEqual(vmess_item['score'], 1)
 
-    @patch('socket.create_connection')
-    def test_validator(self, mock_socket):
+    def test_processor_dedups_endpoints(self):
+        processor = Processor(self.config)
+        processed = processor.process([
+            "vless://uuid@1.2.3.4:443?type=ws&sni=test.com#A",
+            "vless://uuid@1.2.3.4:443?sni=test.com&type=ws#B",
+        ])
+        self.assertEqual(len(processed), 1)
+        self.assertTrue(processed[0]['config'].endswith("#A"))
+
+    def test_processor_keeps_cdn_fronted_configs(self):
+        # Same CDN IP and port, different credentials and SNI: both are usable
+        processor = Processor(self.config)
+        processed = processor.process([
+            "vless://u1@104.16.1.1:443?security=tls&sni=a.com&type=ws#A",
+            "vless://u2@104.16.1.1:443?security=tls&sni=b.com&type=ws#B",
+        ])
+        self.assertEqual(len(processed), 2)
+
+    def test_processor_rejects_malformed_vmess(self):
+        body = base64.b64encode(b'{"add": ["1.2.3.4"], "port": "443"}').decode()
+        processor = Processor(self.config)
+        self.assertEqual(processor.process(["vmess://" + body]), [])
+
+    @patch.object(Validator, 'probe_tcp', new_callable=AsyncMock)
+    def test_validator(self, mock_probe):
         # Mock successful connection
-        mock_socket.return_value.close.return_value = None
+        mock_probe.return_value = 12.5
 
         validator = Validator(self.config)
         # Using processed output from previous step manually constructed
@@ -65,6 +94,32 @@ class TestUnifiedCollector(unittest.TestCase):
         self.assertEqual(len(validated), 2)
         self.assertIsNotNone(validated[0]['latency'])
 
+    def test_probe_tcp_out_of_range_port(self):
+        validator = Validator(self.config)
+        processed_input = [
+            {'config': 'c1', 'info': {'ip': '127.0.0.1', 'port': '99999'}, 'score': 10}
+        ]
+        self.assertEqual(validator.validate_configs(processed_input), [])
+
+    def _fetch_body(self, body):
+        fetcher = UnifiedFetcher(self.config)
+        response = MagicMock()
+        response.iter_content.return_value = [body]
+        fetcher.session.get = MagicMock()
+        fetcher.session.get.return_value.__enter__.return_value = response
+        return fetcher.fetch_url_with_retry("http://example.com/sub.txt")
+
+    def test_fetch_truncates_at_last_line(self):
+        line = b"vless://uuid@1.2.3.4:443\n"
+        body = line * (MAX_RESPONSE_BYTES // len(line) + 10)
+        data = self._fetch_body(body)
+        self.assertLessEqual(len(data), MAX_RESPONSE_BYTES)
+        self.assertTrue(data.endswith(line))
+
+    def test_fetch_truncates_single_line_body_at_cap(self):
+        data = self._fetch_body(b"A" * (MAX_RESPONSE_BYTES + 100))
+        self.assertEqual(len(data), MAX_RESPONSE_BYTES)
+
     def test_output_manager(self):
         output = OutputManager(self.config)
         test_data = [